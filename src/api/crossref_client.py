@@ -1,40 +1,220 @@
 """This is the Client for interacting with the Crossref API."""
 
+import hashlib
+import json
+import logging
 import os
 import re
+import shutil
+import threading
 import time
+from functools import lru_cache
 from typing import Dict, Optional, List
 import requests
 from pathlib import Path
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from urllib3.util.retry import Retry
 from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 
+logger = logging.getLogger(__name__)
+
+# Transport errors are retried by the session adapter, this only covers malformed
+# responses: invalid JSON, or JSON without the expected keys
+_retry_malformed_response = retry(
+    retry=retry_if_exception_type((requests.JSONDecodeError, KeyError)),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=4, max=10),
+    reraise=True
+)
+
+
+def _any_element_clickable(xpath: str):
+    """Wait condition for the first element matching xpath that is visible and enabled.
+
+    EC.element_to_be_clickable only checks the first match, so a hidden element earlier
+    in the document would hide a clickable one further down.
+    """
+    def _predicate(driver):
+        for element in driver.find_elements(By.XPATH, xpath):
+            try:
+                if element.is_displayed() and element.is_enabled():
+                    return element
+            except StaleElementReferenceException:
+                continue
+        return False
+
+    return _predicate
+
 
 class CrossrefClient:
     """Client for fetching paper metadata and PDFs from Crossref."""
 
     BASE_URL = "https://api.crossref.org/works"
 
-    def __init__(self, email: Optional[str] = None):
+    # Direct PDF URL patterns by DOI prefix, built from the paper's landing page
+    DIRECT_PDF_URLS = {
+        "10.3390": "{landing_url}/pdf",  # MDPI
+    }
+
+    # Download dropdown and its PDF option
+    DOWNLOAD_DROPDOWN_SELECTOR = "//button[contains(text(), 'Download')]"
+    DOWNLOAD_PDF_OPTION_SELECTOR = "//a[contains(text(), 'Download PDF')]"
+
+    # Direct download buttons, matched with a single XPath union
+    DOWNLOAD_SELECTORS = " | ".join([
+        "//button[contains(text(), 'Download PDF')]",
+        "//a[contains(text(), 'Download PDF')]",
+        "//button[contains(@class, 'download')]//span[contains(text(), 'PDF')]",
+        "//div[@class='dropdown-menu show']//a[contains(text(), 'Download PDF')]",
+        "//button[@id='download-button']"
+    ])
+
+    def __init__(self, email: Optional[str] = None, cache_dir: Optional[Path] = None):
         """Initialize the client for crossref.
 
         Args:
             email: Email for use of the API
+            cache_dir: Directory for cached metadata responses
         """
         self.email = email or os.getenv("CROSSREF_EMAIL")
+
+        # Metadata for a DOI doesn't change, so responses are cached on disk
+        self.cache_dir = Path(cache_dir or os.getenv("CROSSREF_CACHE", "data/cache/crossref"))
+        cache_ttl = os.getenv("CROSSREF_CACHE_TTL")
+        self.cache_ttl = float(cache_ttl) if cache_ttl else None  # Seconds, None never expires
+
         self.session = requests.Session()
 
+        # Keep connections alive across concurrent workers and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"]
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Metadata already fetched in this run, keyed by clean DOI
+        self._metadata_cache: Dict[str, Dict] = {}
+
         # Set the user agent
         if self.email:
             self.session.headers.update({
                 "User-Agent": f"CrossrefDataExtraction/1.0 (mailto:{self.email})"
             })
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+        # One Chrome driver per thread, reused across downloads
+        self._driver_local = threading.local()
+        self._drivers: List[webdriver.Chrome] = []
+        self._drivers_lock = threading.Lock()
+
+    def __enter__(self) -> "CrossrefClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Quit all Selenium drivers and close the HTTP session."""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning("Error closing Chrome driver: %s", e)
+
+        self.session.close()
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _chrome_options(cls, download_dir: str) -> Options:
+        """Build the Chrome options for a download directory, cached per directory.
+
+        Args:
+            download_dir: Absolute path of the download directory
+
+        Returns:
+            Configured Chrome options
+        """
+        # Setup Chrome options
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")  # Run in background
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+
+        # Set download directory
+        prefs = {
+            "download.default_directory": download_dir,
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True,
+            "plugins.always_open_pdf_externally": True
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+
+        # Record DevTools events so download progress can be read back
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        return chrome_options
+
+    def _get_driver(self, output_dir: Path) -> webdriver.Chrome:
+        """Return the Chrome driver for the current thread, creating it if needed.
+
+        Args:
+            output_dir: Directory the browser should download files to
+
+        Returns:
+            Chrome driver bound to output_dir
+        """
+        download_dir = str(output_dir.absolute())
+        driver = getattr(self._driver_local, "driver", None)
+
+        # The download directory is fixed when Chrome starts
+        if driver is not None and self._driver_local.download_dir == download_dir:
+            return driver
+
+        if driver is not None:
+            self._quit_driver(driver)
+
+        chrome_options = self._chrome_options(download_dir)
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.implicitly_wait(0)  # Missing elements are handled by explicit waits
+        self._driver_local.driver = driver
+        self._driver_local.download_dir = download_dir
+
+        with self._drivers_lock:
+            self._drivers.append(driver)
+
+        return driver
+
+    def _quit_driver(self, driver: webdriver.Chrome) -> None:
+        """Quit a driver and forget it, e.g. after it has crashed."""
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+
+        if getattr(self._driver_local, "driver", None) is driver:
+            self._driver_local.driver = None
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @_retry_malformed_response
     def get_metadata(self, doi: str) -> Dict:
         """Fetch metadata for one of the paper from Crossref.
 
@@ -44,17 +224,124 @@ class CrossrefClient:
         Returns:
             Dictionary containing paper metadata
         """
-        # Clean DOI and remove https://doi.org/ prefix if present
-        doi = doi.replace("https://doi.org/", "")
+        doi = self.clean_doi(doi)
+
+        metadata = self._get_cached_metadata(doi)
+        if metadata is not None:
+            return metadata
 
         url = f"{self.BASE_URL}/{doi}"
         response = self.session.get(url)
         response.raise_for_status()
 
-        return response.json()["message"]
+        metadata = response.json()["message"]
+        self._store_metadata(doi, metadata)
+
+        return metadata
+
+    @_retry_malformed_response
+    def get_metadata_batch(self, dois: List[str]) -> Dict[str, Dict]:
+        """Fetch metadata for several papers with a single Crossref request.
+
+        Only DOIs missing from the cache are requested, and the new results
+        are cached for later get_metadata calls.
+
+        Args:
+            dois: The DOIs of the papers
+
+        Returns:
+            Dictionary mapping lowercase DOI to paper metadata
+        """
+        results = {}
+        missing = []
+
+        for doi in dois:
+            doi = self.clean_doi(doi)
+            metadata = self._get_cached_metadata(doi)
+
+            if metadata is not None:
+                results[doi] = metadata
+            else:
+                missing.append(doi)
+
+        if not missing:
+            return results
+
+        params = {
+            "filter": ",".join(f"doi:{doi}" for doi in missing),
+            "rows": len(missing)
+        }
+        response = self.session.get(self.BASE_URL, params=params)
+        response.raise_for_status()
+
+        fetched = {item["DOI"].lower(): item for item in response.json()["message"]["items"]}
+        results.update(fetched)
+
+        for doi in missing:
+            if doi in fetched:
+                self._store_metadata(doi, fetched[doi])
+
+        return results
+
+    @staticmethod
+    def clean_doi(doi: str) -> str:
+        """Remove the doi.org prefix and lowercase a DOI, which is case-insensitive."""
+        return doi.removeprefix("https://doi.org/").removeprefix("http://doi.org/").lower()
+
+    def _metadata_cache_path(self, doi: str) -> Path:
+        """Return the on-disk cache file for a clean DOI."""
+        return self.cache_dir / f"{hashlib.sha1(doi.encode()).hexdigest()}.json"
+
+    def _get_cached_metadata(self, doi: str) -> Optional[Dict]:
+        """Look up metadata in the in-memory cache, then on disk.
+
+        Args:
+            doi: Clean DOI (see clean_doi)
+
+        Returns:
+            Cached metadata, or None if missing or expired
+        """
+        if doi in self._metadata_cache:
+            return self._metadata_cache[doi]
+
+        cache_path = self._metadata_cache_path(doi)
+        try:
+            if self.cache_ttl is not None and time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+
+            metadata = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        self._metadata_cache[doi] = metadata
+        return metadata
+
+    def _store_metadata(self, doi: str, metadata: Dict) -> None:
+        """Cache metadata in memory and on disk.
+
+        Args:
+            doi: Clean DOI (see clean_doi)
+            metadata: Metadata returned by Crossref
+        """
+        self._metadata_cache[doi] = metadata
+
+        cache_path = self._metadata_cache_path(doi)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first so readers never see a partial file
+            tmp_path.write_text(json.dumps(metadata), encoding="utf-8")
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.warning("Could not cache metadata for %s: %s", doi, e)
+            tmp_path.unlink(missing_ok=True)
 
     def download_pdf(self, doi: str, output_dir: Path) -> Optional[Path]:
-        """Download PDF for a paper by using Selenium.
+        """Download PDF for a paper, falling back to Selenium.
+
+        A direct HTTP download is tried first for publishers with a known
+        PDF URL pattern; Selenium is only used if that fails.
 
         Args:
             doi: The DOI of the paper
@@ -63,8 +350,7 @@ class CrossrefClient:
         Returns:
             Path to the downloaded PDF, or None if not available
         """
-        # Clean DOI
-        doi_clean = doi.replace("https://doi.org/", "")
+        doi_clean = self.clean_doi(doi)
 
         # Create output directory if it doesn't exist
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -73,162 +359,282 @@ class CrossrefClient:
         filename = doi_clean.replace("/", "_") + ".pdf"
         output_path = output_dir / filename
 
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in background
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
+        # Try a plain HTTP download first, it avoids starting a browser
+        pdf_path = self._download_pdf_direct(doi_clean, output_path)
+        if pdf_path:
+            return pdf_path
 
-        # Set download directory
-        prefs = {
-            "download.default_directory": str(output_dir.absolute()),
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "plugins.always_open_pdf_externally": True
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
+        # Workers download in parallel, so each thread gets its own download directory
+        # and can't pick up another paper's PDF or wait on its temporary files
+        download_dir = output_dir / f".download-{threading.get_ident()}"
+        shutil.rmtree(download_dir, ignore_errors=True)
+        download_dir.mkdir(parents=True, exist_ok=True)
 
         driver = None
         try:
-            # Initialize Chrome driver
-            driver = webdriver.Chrome(options=chrome_options)
+            # Reuse this thread's Chrome driver
+            driver = self._get_driver(download_dir)
+            events_enabled = self._enable_download_events(driver, download_dir)
 
             # Navigate to the DOI URL
             doi_url = f"https://doi.org/{doi_clean}"
-            print(f"Navigating to: {doi_url}")
+            logger.info("Navigating to: %s", doi_url)
             driver.get(doi_url)
 
-            # Wait for the page to load and find the download button
-            wait = WebDriverWait(driver, 10)
-
-            # Try different selectors for the download button
-            download_selectors = [
-                "//button[contains(text(), 'Download PDF')]",
-                "//a[contains(text(), 'Download PDF')]",
-                "//button[contains(@class, 'download')]//span[contains(text(), 'PDF')]",
-                "//div[@class='dropdown-menu show']//a[contains(text(), 'Download PDF')]",
-                "//button[@id='download-button']"
-            ]
-
             download_clicked = False
 
             # First try to click the Download dropdown if it exists
             try:
-                download_dropdown = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Download')]"))
+                download_dropdown = WebDriverWait(driver, 2).until(
+                    EC.element_to_be_clickable((By.XPATH, self.DOWNLOAD_DROPDOWN_SELECTOR))
                 )
                 download_dropdown.click()
-                time.sleep(1)  # Wait for dropdown to open
 
                 # Now look for PDF option in dropdown
-                pdf_option = driver.find_element(By.XPATH, "//a[contains(text(), 'Download PDF')]")
+                pdf_option = WebDriverWait(driver, 2).until(
+                    EC.element_to_be_clickable((By.XPATH, self.DOWNLOAD_PDF_OPTION_SELECTOR))
+                )
                 pdf_option.click()
                 download_clicked = True
-                print("Clicked PDF download from dropdown")
-
-            except:
-                # Try direct download button
-                for selector in download_selectors:
-                    try:
-                        download_button = wait.until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                        download_button.click()
-                        download_clicked = True
-                        print(f"Clicked download button with selector: {selector}")
-                        break
-                    except:
-                        continue
+                logger.info("Clicked PDF download from dropdown")
+
+            except Exception:
+                # Try any direct download button at once
+                try:
+                    download_button = WebDriverWait(driver, 3).until(
+                        _any_element_clickable(self.DOWNLOAD_SELECTORS)
+                    )
+                    download_button.click()
+                    download_clicked = True
+                    logger.info("Clicked download button")
+                except Exception:
+                    pass
 
             if not download_clicked:
                 # If no download button found, try direct PDF URL
                 current_url = driver.current_url
                 if "mdpi.com" in current_url:
                     pdf_url = current_url.rstrip('/') + "/pdf"
-                    print(f"Trying direct PDF URL: {pdf_url}")
+                    logger.info("Trying direct PDF URL: %s", pdf_url)
                     driver.get(pdf_url)
                     download_clicked = True
 
             if download_clicked:
                 # Wait for download to complete
-                print("Waiting for download to complete...")
-                time.sleep(5)
-
-                # Check if file was downloaded (with temporary name)
-                temp_files = list(output_dir.glob("*.crdownload")) + list(output_dir.glob("*.tmp"))
-                max_wait = 30  # Maximum 30 seconds wait
-                wait_time = 0
+                logger.info("Waiting for download to complete...")
+                downloaded_pdf = None
 
-                while temp_files and wait_time < max_wait:
-                    time.sleep(1)
-                    wait_time += 1
-                    temp_files = list(output_dir.glob("*.crdownload")) + list(output_dir.glob("*.tmp"))
-
-                # Look for the downloaded PDF
-                pdf_files = list(output_dir.glob("*.pdf"))
-
-                # Find the most recently downloaded PDF
-                if pdf_files:
-                    latest_pdf = max(pdf_files, key=lambda p: p.stat().st_mtime)
+                if events_enabled:
+                    try:
+                        downloaded_pdf = self._wait_for_download_event(driver, download_dir)
+                    except Exception as e:
+                        # Also covers a timeout, the file may still have downloaded without events.
+                        # The event wait already gave the download time to start, so only
+                        # look at files that are already there
+                        logger.warning("No download event received, polling instead: %s", e)
+                        downloaded_pdf = self._wait_for_download_polling(download_dir, start_timeout=0)
+                else:
+                    downloaded_pdf = self._wait_for_download_polling(download_dir)
 
-                    # Rename to our expected filename if different
-                    if latest_pdf.name != filename:
-                        latest_pdf.rename(output_path)
+                if downloaded_pdf:
+                    # Move out of the download directory under our expected filename
+                    downloaded_pdf.replace(output_path)
 
-                    print(f"Successfully downloaded PDF to: {output_path}")
+                    logger.info("Successfully downloaded PDF to: %s", output_path)
                     return output_path
                 else:
-                    print("No PDF file found after download attempt")
+                    logger.warning("No PDF file found after download attempt")
 
         except Exception as e:
-            print(f"Error downloading PDF with Selenium: {e}")
+            logger.error("Error downloading PDF with Selenium: %s", e)
+
+            # Don't reuse a driver that may be in a broken state
+            if driver:
+                self._quit_driver(driver)
+                driver = None
 
         finally:
+            # Avoid carrying cookies or sessions over to the next paper. delete_all_cookies
+            # only covers the current page's domain, this clears doi.org and every publisher
+            # the redirects went through
             if driver:
-                driver.quit()
+                try:
+                    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                except Exception:
+                    self._quit_driver(driver)
+
+            # Drop partial or unexpected files left by this download
+            shutil.rmtree(download_dir, ignore_errors=True)
+
+        return None
+
+    def _enable_download_events(self, driver: webdriver.Chrome, output_dir: Path) -> bool:
+        """Set the download directory and prepare to read download events.
+
+        chromedriver's performance log only records Network, Page and Tracing
+        events, so completion is detected from the (deprecated) Page.download*
+        events; Browser.download* events never reach the log.
+
+        Args:
+            driver: Chrome driver used for the download
+            output_dir: Directory to save downloads to
+
+        Returns:
+            True if download events will be available in the performance log
+        """
+        try:
+            driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": str(output_dir.absolute())
+            })
+
+            # Drop events left over from a previous download on this driver
+            driver.get_log("performance")
+            return True
+
+        except Exception as e:
+            logger.warning("Could not enable download events: %s", e)
+            return False
+
+    def _wait_for_download_event(self, driver: webdriver.Chrome, output_dir: Path,
+                                 start_timeout: float = 5, timeout: float = 30) -> Optional[Path]:
+        """Wait for Chrome to report the download as finished.
+
+        Args:
+            driver: Chrome driver used for the download
+            output_dir: Directory the file is downloaded to
+            start_timeout: Maximum number of seconds to wait for the download to begin
+            timeout: Maximum number of seconds to wait once it has begun
+
+        Returns:
+            Path to the downloaded file, or None if the browser canceled it
+
+        Raises:
+            TimeoutError: If the download didn't begin, or didn't finish, in time
+        """
+        # Give up early if nothing starts, the long timeout only applies to a running download
+        deadline = time.monotonic() + start_timeout
+        suggested_filename = None
+        download_started = False
+
+        while time.monotonic() < deadline:
+            for entry in driver.get_log("performance"):
+                message = json.loads(entry["message"])["message"]
+                method = message.get("method", "")
+                params = message.get("params", {})
+
+                # Page domain events, the only download events in the performance log
+                if method == "Page.downloadWillBegin":
+                    suggested_filename = params.get("suggestedFilename")
+                    if not download_started:
+                        download_started = True
+                        deadline = time.monotonic() + timeout
+
+                elif method == "Page.downloadProgress":
+                    if params.get("state") == "completed":
+                        if suggested_filename and (output_dir / suggested_filename).exists():
+                            return output_dir / suggested_filename
+                        return self._find_latest_pdf(output_dir)
+
+                    if params.get("state") == "canceled":
+                        logger.warning("Download was canceled by the browser")
+                        return None
+
+            time.sleep(0.1)
+
+        if not download_started:
+            raise TimeoutError(f"no download began within {start_timeout}s")
+
+        raise TimeoutError(f"no completed download reported within {timeout}s")
 
-        # Fallback to requests method for direct PDF URLs
-        return self._download_pdf_requests_fallback(doi_clean, output_path)
+    def _wait_for_download_polling(self, output_dir: Path, start_timeout: float = 5) -> Optional[Path]:
+        """Wait for a download by watching for temporary files to disappear.
 
-    def _download_pdf_requests_fallback(self, doi: str, output_path: Path) -> Optional[Path]:
-        """Fallback method using requests for direct PDF downloads.
+        Args:
+            output_dir: Directory the file is downloaded to
+            start_timeout: Maximum number of seconds to wait for a PDF or temporary file to appear
+
+        Returns:
+            Path to the most recent PDF in output_dir, or None
+        """
+        # Wait for the download to show up, instead of always sleeping
+        deadline = time.monotonic() + start_timeout
+        temp_files = list(output_dir.glob("*.crdownload")) + list(output_dir.glob("*.tmp"))
+
+        while not temp_files and not self._find_latest_pdf(output_dir) and time.monotonic() < deadline:
+            time.sleep(0.5)
+            temp_files = list(output_dir.glob("*.crdownload")) + list(output_dir.glob("*.tmp"))
+
+        # Check if file was downloaded (with temporary name)
+        max_wait = 30  # Maximum 30 seconds wait
+        wait_time = 0
+
+        while temp_files and wait_time < max_wait:
+            time.sleep(1)
+            wait_time += 1
+            temp_files = list(output_dir.glob("*.crdownload")) + list(output_dir.glob("*.tmp"))
+
+        return self._find_latest_pdf(output_dir)
+
+    def _find_latest_pdf(self, output_dir: Path) -> Optional[Path]:
+        """Return the most recently modified PDF in a directory, if any."""
+        pdf_files = list(output_dir.glob("*.pdf"))
+        if not pdf_files:
+            return None
+
+        return max(pdf_files, key=lambda p: p.stat().st_mtime)
+
+    def _download_pdf_direct(self, doi: str, output_path: Path) -> Optional[Path]:
+        """Download a PDF directly over HTTP using the publisher URL pattern.
 
         Args:
-            doi: Clean DOI (without https://doi.org/)
+            doi: Clean DOI (see clean_doi)
             output_path: Path to save the PDF
 
         Returns:
             Path to downloaded PDF or None
         """
-        # Try constructing direct MDPI URL
-        if "10.3390" in doi:
-            try:
-                # Get metadata to find the actual URL
-                metadata = self.get_metadata(doi)
+        url_template = self.DIRECT_PDF_URLS.get(doi.split("/", 1)[0])
+        if not url_template:
+            return None
 
-                if "URL" in metadata:
-                    base_url = metadata["URL"]
-                    pdf_url = base_url.rstrip('/') + "/pdf"
+        try:
+            # Served from the cache when the metadata was fetched earlier
+            metadata = self.get_metadata(doi)
 
-                    print(f"Fallback: Trying direct download from {pdf_url}")
+            # Prefer the publisher landing page over the doi.org URL
+            landing_url = metadata.get("resource", {}).get("primary", {}).get("URL") or metadata.get("URL")
+            if not landing_url:
+                return None
 
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                    }
+            pdf_url = url_template.format(landing_url=landing_url.rstrip('/'))
 
-                    response = self.session.get(pdf_url, stream=True, headers=headers)
-                    response.raise_for_status()
+            logger.info("Trying direct download from %s", pdf_url)
 
-                    with open(output_path, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            }
 
-                    print(f"Successfully downloaded PDF to: {output_path}")
-                    return output_path
+            with self.session.get(pdf_url, stream=True, headers=headers) as response:
+                response.raise_for_status()
 
-            except Exception as e:
-                print(f"Fallback download failed: {e}")
+                # A redirect to an HTML page means the PDF is gated
+                content_type = response.headers.get("Content-Type", "")
+                if "pdf" not in content_type:
+                    logger.info("Direct download returned %s, not a PDF", content_type or "unknown content")
+                    return None
+
+                # Copy straight from the urllib3 stream in 1 MiB blocks
+                response.raw.decode_content = True
+                with open(output_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+
+            logger.info("Successfully downloaded PDF to: %s", output_path)
+            return output_path
+
+        except Exception as e:
+            logger.warning("Direct download failed: %s", e)
+            output_path.unlink(missing_ok=True)
 
         return None
 
@@ -241,21 +647,22 @@ class CrossrefClient:
         Returns:
             Dictionary with extracted information
         """
-        # Extract authors
-        authors = []
-        if "author" in metadata:
-            for author in metadata["author"]:
-                name = f"{author.get('given', '')} {author.get('family', '')}".strip()
-                if name:
-                    authors.append(name)
+        # Extract authors, skipping ones with neither given nor family name
+        authors = [
+            name for author in metadata.get("author", ())
+            if (name := " ".join(filter(None, (author.get("given"), author.get("family")))))
+        ]
 
         # Extract other information
+        titles = metadata.get("title") or [""]
+        container_titles = metadata.get("container-title") or [""]
+
         return {
             "doi": metadata.get("DOI", ""),
-            "title": metadata.get("title", [""])[0] if metadata.get("title") else "",
+            "title": titles[0],
             "authors": authors,
             "publication_date": metadata.get("published-print", {}).get("date-parts", [[None]])[0],
-            "journal": metadata.get("container-title", [""])[0] if metadata.get("container-title") else "",
+            "journal": container_titles[0],
             "publisher": metadata.get("publisher", ""),
             "abstract": metadata.get("abstract", "")
-        }
\ No newline at end of file
+        }
@@ -1,10 +1,11 @@
 """Base class for all extractors."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Dict
 from pathlib import Path
 
-from ..models.schemas import PaperMetadata, ExtractedData
+from ..models.schemas import MechanicalProperty, PaperMetadata, ExtractedData
 
 
 class BaseExtractor(ABC):
@@ -28,7 +29,7 @@ class BaseExtractor(ABC):
         pass
 
     @abstractmethod
-    def extract_properties(self, text: str, paper_info: Dict) -> List[Dict]:
+    def extract_properties(self, text: str, paper_info: Dict) -> List[MechanicalProperty]:
         """Extract mechanical properties from text.
 
         Args:
@@ -36,7 +37,7 @@ class BaseExtractor(ABC):
             paper_info: Metadata about the paper
 
         Returns:
-            List of extracted mechanical properties as dictionaries
+            List of validated mechanical properties
         """
         pass
 
@@ -51,4 +52,19 @@ class BaseExtractor(ABC):
         Returns:
             ExtractedData object with all extracted properties
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def aextract_from_paper(self, pdf_path: Path, paper_metadata: PaperMetadata) -> ExtractedData:
+        """Async version of extract_from_paper.
+
+        Runs extract_from_paper in a worker thread by default; extractors
+        with native async I/O should override this.
+
+        Args:
+            pdf_path: Path to the PDF file
+            paper_metadata: Metadata about the paper
+
+        Returns:
+            ExtractedData object with all extracted properties
+        """
+        return await asyncio.to_thread(self.extract_from_paper, pdf_path, paper_metadata)
\ No newline at end of file
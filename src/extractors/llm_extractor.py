@@ -1,68 +1,153 @@
 """LLM-based extractor for mechanical properties from PDFs."""
 
+import asyncio
+import io
+import logging
 import os
-import json
-from typing import List, Dict, Optional
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import ClassVar, Iterable, List, Dict, Optional
 from pathlib import Path
-import PyPDF2
-from openai import OpenAI
+import ijson
+import orjson
+import tiktoken
+from pypdf import PdfReader
+from openai import AsyncOpenAI, OpenAI
+from pydantic import TypeAdapter, ValidationError
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .base_extractor import BaseExtractor
 from ..models.schemas import MechanicalProperty, PaperMetadata, ExtractedData
 
+logger = logging.getLogger(__name__)
 
-class LLMExtractor(BaseExtractor):
-    """Extract mechanical properties from PDFs using Large Language Models."""
+# Separates pages in the extracted text
+PAGE_SEPARATOR = "\f"
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
-        """Initialize the LLM extractor.
+# Decimal numbers, used to find pages that are likely to hold tables
+_DECIMAL_RE = re.compile(r"\d+\.\d+")
 
-        Args:
-            api_key: OpenAI API key
-            model: Model to use (default: gpt-4-turbo-preview)
-        """
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.model = model or os.getenv("OPENAI_MODEL", "gpt-4.1")
+# Validates a whole list of properties at once
+_PROPERTY_LIST_ADAPTER = TypeAdapter(List[MechanicalProperty])
 
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required")
 
-        self.client = OpenAI(api_key=self.api_key)
+def _extract_page(pdf_bytes: bytes, page_index: int) -> str:
+    """Extract the text of a single PDF page, run in a worker process.
 
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract text content from a PDF file.
+    Args:
+        pdf_bytes: Raw content of the PDF file
+        page_index: Index of the page to extract
+
+    Returns:
+        Extracted text of the page
+    """
+    pdf_reader = PdfReader(io.BytesIO(pdf_bytes))
+    return pdf_reader.pages[page_index].extract_text() or ""
+
+
+def _clean_property(prop):
+    """Strip thousands separators from a string value, pydantic converts the rest."""
+    if isinstance(prop, dict) and isinstance(prop.get("value"), str):
+        return {**prop, "value": prop["value"].replace(",", "")}
+    return prop
+
+
+class _PropertyStream:
+    """Parse and validate properties from a streamed LLM response.
+
+    Each item of the "properties" array is validated as a MechanicalProperty
+    as soon as it closes. An item that doesn't match the schema means the
+    model has drifted from the requested format, so the caller should stop
+    reading the stream; the properties validated up to then are kept.
+    Responses in another shape are parsed in full once the stream ends.
+    """
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._items = ijson.sendable_list()
+        self._parser = ijson.items_coro(self._items, "properties.item", use_float=True)
+        self._incremental = True
+        self.drifted = False
+        self.properties: List[MechanicalProperty] = []
+
+    def feed(self, content: str) -> bool:
+        """Feed the next chunk of the response.
 
         Args:
-            pdf_path: Path to the PDF file
+            content: Text delta from the stream
 
         Returns:
-            Extracted text content
+            False if the response drifted from the schema and should be abandoned
         """
-        text = ""
-
-        with open(pdf_path, "rb") as file:
-            pdf_reader = PyPDF2.PdfReader(file)
+        self._chunks.append(content)
+        if not self._incremental:
+            return True
 
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
+        try:
+            self._parser.send(content.encode("utf-8"))
+        except ijson.JSONError:
+            # Leave it to the full parse at the end
+            self._incremental = False
+            return True
 
-        return text
+        return self._validate_items()
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def extract_properties(self, text: str, paper_info: Dict) -> List[Dict]:
-        """Use LLM to extract mechanical properties from text.
+    def finish(self, parse_properties) -> List[MechanicalProperty]:
+        """Finish parsing once the stream ends or is abandoned.
 
         Args:
-            text: Full text of the paper
-            paper_info: Metadata about the paper
+            parse_properties: Fallback parser for the full response content
 
         Returns:
-            List of extracted mechanical properties
+            All valid properties
         """
-        # Create a focused prompt for mechanical property extraction
-        system_prompt = """You are an expert materials scientist tasked with extracting mechanical property data from academic papers. 
+        if self.drifted:
+            return self.properties
+
+        if self._incremental:
+            try:
+                self._parser.close()
+                self._validate_items()
+            except ijson.JSONError:
+                self._incremental = False
+
+        if self.drifted or (self._incremental and self.properties):
+            return self.properties
+
+        return parse_properties("".join(self._chunks))
+
+    def _validate_items(self) -> bool:
+        """Validate items completed since the last call, stopping at the first invalid one."""
+        items = list(self._items)
+        del self._items[:]
+
+        for item in items:
+            try:
+                self.properties.append(MechanicalProperty.model_validate(_clean_property(item)))
+            except ValidationError as e:
+                logger.warning("Abandoning response, property doesn't match the schema: %s, Error: %s", item, e)
+                self.drifted = True
+                return False
+
+        return True
+
+
+class LLMExtractor(BaseExtractor):
+    """Extract mechanical properties from PDFs using Large Language Models."""
+
+    # Stop reading pages once this much text is extracted, well beyond what fits in the prompt
+    MAX_TEXT_CHARS = 100000
+
+    # Token budget for the paper text in the prompt
+    MAX_PROMPT_TOKENS = 6000
+
+    # PDFs with at least this many pages are extracted in worker processes
+    PARALLEL_MIN_PAGES = 8
+
+    # Focused prompts for mechanical property extraction, only title and text vary per call
+    SYSTEM_PROMPT: ClassVar[str] = """You are an expert materials scientist tasked with extracting mechanical property data from academic papers. 
         Focus on finding tabular data that reports mechanical properties such as:
         - Tensile strength (UTS, YS)
         - Hardness (HV, HB, etc.)
@@ -81,16 +166,16 @@ class LLMExtractor(BaseExtractor):
         6. Test temperature (if mentioned)
         7. Any other relevant parameters
 
-        Return the data as a JSON array of objects."""
+        Return the data as a JSON object with a "properties" array of objects."""
 
-        user_prompt = f"""Paper Title: {paper_info.get('title', 'Unknown')}
+    USER_PROMPT_TEMPLATE: ClassVar[str] = """Paper Title: {title}
 
 Please extract all mechanical property data from the tables in this paper. Focus on finding structured tabular data.
 
 Paper text:
-{text[:8000]}  # Limit text to avoid token limits
+{text}
 
-Return the extracted data as a JSON array. Each object should have these fields:
+Return the extracted data as a JSON object with a "properties" array. Each item should have these fields:
 - material: string (material or alloy composition)
 - condition: string or null (processing condition)
 - property_name: string
@@ -102,41 +187,319 @@ Return the extracted data as a JSON array. Each object should have these fields:
 - additional_info: object (any other parameters)
 """
 
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+        """Initialize the LLM extractor.
+
+        Args:
+            api_key: OpenAI API key
+            model: Model to use (default: gpt-4-turbo-preview)
+        """
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.model = model or os.getenv("OPENAI_MODEL", "gpt-4.1")
+
+        if not self.api_key:
+            raise ValueError("OpenAI API key is required")
+
+        self.client = OpenAI(api_key=self.api_key)
+        self.aclient = AsyncOpenAI(api_key=self.api_key)
+
+        # Token encoding for the model, loaded on first use since it may need a download
+        self._encoding: Optional[tiktoken.Encoding] = None
+        self._encoding_loaded = False
+        self._encoding_lock = threading.Lock()
+
+        # Process pool for page text extraction, created on first use
+        self._page_pool: Optional[ProcessPoolExecutor] = None
+        self._page_pool_lock = threading.Lock()
+
+    def __enter__(self) -> "LLMExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "LLMExtractor":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the async OpenAI client and shut down worker processes."""
+        await self.aclient.close()
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the page extraction worker processes."""
+        with self._page_pool_lock:
+            page_pool, self._page_pool = self._page_pool, None
+
+        if page_pool:
+            page_pool.shutdown(cancel_futures=True)
+
+    def _get_page_pool(self) -> ProcessPoolExecutor:
+        """Return the shared page extraction pool, creating it if needed."""
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                # Spawn rather than fork, the parent runs Selenium and HTTP threads
+                self._page_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+
+            return self._page_pool
+
+    def extract_text_from_pdf(self, pdf_path: Path) -> str:
+        """Extract text content from a PDF file.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Extracted text content
+        """
+        pdf_bytes = pdf_path.read_bytes()
+        pdf_reader = PdfReader(io.BytesIO(pdf_bytes))
+        page_count = len(pdf_reader.pages)
+
+        # Starting worker processes isn't worth it for short papers
+        if page_count < self.PARALLEL_MIN_PAGES:
+            return self._join_pages(page.extract_text() or "" for page in pdf_reader.pages)
+
+        page_pool = self._get_page_pool()
+        futures = [page_pool.submit(_extract_page, pdf_bytes, i) for i in range(page_count)]
+
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,  # Low temperature for consistent extraction
-                response_format={"type": "json_object"}
-            )
-
-            # Parse the response
-            content = response.choices[0].message.content
-            data = json.loads(content)
-
-            # Handle different response formats
-            if isinstance(data, dict):
-                # If the LLM wrapped the array in an object
-                if "properties" in data:
-                    return data["properties"]
-                elif "data" in data:
-                    return data["data"]
-                else:
-                    # Try to find the first array value
-                    for value in data.values():
-                        if isinstance(value, list):
-                            return value
-            elif isinstance(data, list):
-                return data
+            return self._join_pages(future.result() for future in futures)
+        finally:
+            # Skip pages past the text budget that haven't started yet
+            for future in futures:
+                future.cancel()
 
-            return []
+    def _join_pages(self, page_texts: Iterable[str]) -> str:
+        """Join page texts in order, stopping once MAX_TEXT_CHARS is reached.
 
-        except Exception as e:
-            print(f"Error in LLM extraction: {e}")
-            return []
+        Args:
+            page_texts: Text of each page, in page order
+
+        Returns:
+            Joined text content
+        """
+        parts = []
+        text_length = 0
+
+        for page_text in page_texts:
+            parts.append(page_text)
+            text_length += len(page_text)
+
+            if text_length > self.MAX_TEXT_CHARS:
+                break
+
+        return PAGE_SEPARATOR.join(parts)
+
+    def _fit_to_token_budget(self, text: str) -> str:
+        """Reduce the paper text to at most MAX_PROMPT_TOKENS tokens.
+
+        When the text is too long, the pages with the most decimal numbers
+        (likely tables) are kept in their original order. If the token
+        encoding can't be loaded, a page is estimated at four characters
+        per token.
+
+        Args:
+            text: Full text of the paper, pages separated by PAGE_SEPARATOR
+
+        Returns:
+            Text that fits in the prompt token budget
+        """
+        encoding = self._get_encoding()
+        pages = text.split(PAGE_SEPARATOR)
+
+        if encoding is not None:
+            page_tokens = encoding.encode_ordinary_batch(pages)
+            page_costs = [len(tokens) for tokens in page_tokens]
+        else:
+            page_costs = [-(-len(page) // 4) for page in pages]
+
+        if sum(page_costs) <= self.MAX_PROMPT_TOKENS:
+            return text
+
+        def truncate(i: int, max_tokens: int) -> str:
+            if encoding is not None:
+                return encoding.decode(page_tokens[i][:max_tokens])
+            return pages[i][:max_tokens * 4]
+
+        # Rank pages by table density, earlier pages win ties
+        ranked = sorted(range(len(pages)), key=lambda i: len(_DECIMAL_RE.findall(pages[i])), reverse=True)
+
+        selected = {}
+        budget = self.MAX_PROMPT_TOKENS
+        for i in ranked:
+            if page_costs[i] <= budget:
+                selected[i] = pages[i]
+                budget -= page_costs[i]
+            elif not selected:
+                # Keep the start of the densest page rather than losing it
+                selected[i] = truncate(i, budget)
+                break
+
+        text = PAGE_SEPARATOR.join(selected[i] for i in sorted(selected))
+
+        # Page separators can still push the text slightly over the budget
+        if encoding is None:
+            return text[:self.MAX_PROMPT_TOKENS * 4]
+
+        tokens = encoding.encode_ordinary(text)
+        return encoding.decode(tokens[:self.MAX_PROMPT_TOKENS])
+
+    def _get_encoding(self) -> Optional[tiktoken.Encoding]:
+        """Return the tiktoken encoding for the model, loading it on first use.
+
+        Loading may download the BPE file, so it is attempted only once per
+        extractor; a failure is remembered and None is returned from then on.
+        """
+        with self._encoding_lock:
+            if not self._encoding_loaded:
+                try:
+                    try:
+                        self._encoding = tiktoken.encoding_for_model(self.model)
+                    except KeyError:
+                        # The installed tiktoken may not know newer models
+                        self._encoding = tiktoken.get_encoding("cl100k_base")
+                except Exception as e:
+                    logger.warning("Could not load token encoding, truncating by characters: %s", e)
+
+                self._encoding_loaded = True
+
+            return self._encoding
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10), reraise=True)
+    def extract_properties(self, text: str, paper_info: Dict) -> List[MechanicalProperty]:
+        """Use LLM to extract mechanical properties from text.
+
+        The response is streamed and each property is validated as soon as
+        it is complete (see _PropertyStream).
+
+        Args:
+            text: Full text of the paper
+            paper_info: Metadata about the paper
+
+        Returns:
+            List of valid mechanical properties
+
+        Raises:
+            Exception: If the LLM call or response parsing still fails after retries
+        """
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(text, paper_info),
+            temperature=0.1,  # Low temperature for consistent extraction
+            response_format={"type": "json_object"},
+            stream=True
+        )
+
+        property_stream = _PropertyStream()
+        with stream:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if not property_stream.feed(chunk.choices[0].delta.content):
+                        # Closing the stream stops the rest of the response from being generated
+                        break
+
+        return property_stream.finish(self._parse_properties)
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10), reraise=True)
+    async def aextract_properties(self, text: str, paper_info: Dict) -> List[MechanicalProperty]:
+        """Async version of extract_properties using the async OpenAI client.
+
+        Args:
+            text: Full text of the paper
+            paper_info: Metadata about the paper
+
+        Returns:
+            List of valid mechanical properties
+
+        Raises:
+            Exception: If the LLM call or response parsing still fails after retries
+        """
+        # Token counting may load the encoding over the network, keep it off the event loop
+        messages = await asyncio.to_thread(self._build_messages, text, paper_info)
+
+        stream = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.1,  # Low temperature for consistent extraction
+            response_format={"type": "json_object"},
+            stream=True
+        )
+
+        property_stream = _PropertyStream()
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if not property_stream.feed(chunk.choices[0].delta.content):
+                        # Closing the stream stops the rest of the response from being generated
+                        break
+
+        return property_stream.finish(self._parse_properties)
+
+    def _build_messages(self, text: str, paper_info: Dict) -> List[Dict]:
+        """Build the chat messages for property extraction.
+
+        Args:
+            text: Full text of the paper
+            paper_info: Metadata about the paper
+
+        Returns:
+            List of chat messages for the LLM
+        """
+        user_prompt = self.USER_PROMPT_TEMPLATE.format(
+            title=paper_info.get('title', 'Unknown'),
+            text=self._fit_to_token_budget(text)
+        )
+
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    def _parse_response(self, content: str) -> List[Dict]:
+        """Parse the LLM response into a list of property dictionaries.
+
+        Args:
+            content: Raw JSON content returned by the LLM
+
+        Returns:
+            List of extracted mechanical properties
+        """
+        data = orjson.loads(content)
+
+        # Handle different response formats
+        if isinstance(data, dict):
+            # If the LLM wrapped the array in an object
+            if "properties" in data:
+                return data["properties"]
+            elif "data" in data:
+                return data["data"]
+            else:
+                # Try to find the first array value
+                for value in data.values():
+                    if isinstance(value, list):
+                        return value
+        elif isinstance(data, list):
+            return data
+
+        return []
+
+    def _parse_properties(self, content: str) -> List[MechanicalProperty]:
+        """Parse and validate a complete LLM response.
+
+        Args:
+            content: Raw JSON content returned by the LLM
+
+        Returns:
+            List of valid MechanicalProperty objects
+        """
+        return self._validate_properties(self._parse_response(content))
 
     def extract_from_paper(self, pdf_path: Path, paper_metadata: PaperMetadata) -> ExtractedData:
         """Extract mechanical properties from a single paper.
@@ -149,35 +512,90 @@ Return the extracted data as a JSON array. Each object should have these fields:
             ExtractedData object with all extracted properties
         """
         # Extract text from PDF
-        print(f"Extracting text from {pdf_path.name}...")
+        logger.info("Extracting text from %s...", pdf_path.name)
         text = self.extract_text_from_pdf(pdf_path)
 
         # Use LLM to extract properties
-        print(f"Extracting mechanical properties using {self.model}...")
-        raw_properties = self.extract_properties(
+        logger.info("Extracting mechanical properties using %s...", self.model)
+        properties = self.extract_properties(
             text,
             paper_metadata.model_dump()
         )
 
-        # Convert to MechanicalProperty objects
-        properties = []
-        for prop in raw_properties:
-            try:
-                # Clean up the data
-                if isinstance(prop.get("value"), str):
-                    # Try to extract numeric value
-                    prop["value"] = float(prop["value"].replace(",", ""))
+        return self._build_extracted_data(properties, paper_metadata)
 
-                mechanical_property = MechanicalProperty(**prop)
-                properties.append(mechanical_property)
-            except Exception as e:
-                print(f"Error parsing property: {prop}, Error: {e}")
-                continue
+    async def aextract_from_paper(self, pdf_path: Path, paper_metadata: PaperMetadata) -> ExtractedData:
+        """Async version of extract_from_paper.
 
-        print(f"Extracted {len(properties)} mechanical properties")
+        Text extraction runs in a worker thread and the LLM call is awaited,
+        so many papers can be extracted concurrently.
+
+        Args:
+            pdf_path: Path to the PDF file
+            paper_metadata: Metadata about the paper
+
+        Returns:
+            ExtractedData object with all extracted properties
+        """
+        # Extract text from PDF
+        logger.info("Extracting text from %s...", pdf_path.name)
+        text = await asyncio.to_thread(self.extract_text_from_pdf, pdf_path)
+
+        # Use LLM to extract properties
+        logger.info("Extracting mechanical properties using %s...", self.model)
+        properties = await self.aextract_properties(
+            text,
+            paper_metadata.model_dump()
+        )
+
+        return self._build_extracted_data(properties, paper_metadata)
+
+    def _build_extracted_data(self, properties: List[MechanicalProperty],
+                              paper_metadata: PaperMetadata) -> ExtractedData:
+        """Wrap validated properties in an ExtractedData object.
+
+        Args:
+            properties: Properties returned by extract_properties
+            paper_metadata: Metadata about the paper
+
+        Returns:
+            ExtractedData object with all valid properties
+        """
+        logger.info("Extracted %d mechanical properties from %s", len(properties), paper_metadata.doi)
 
         return ExtractedData(
             paper_metadata=paper_metadata,
             mechanical_properties=properties,
             extraction_method="llm"
-        )
\ No newline at end of file
+        )
+
+    def _validate_properties(self, raw_properties: List[Dict]) -> List[MechanicalProperty]:
+        """Validate all properties in one pass, skipping the invalid ones.
+
+        Args:
+            raw_properties: Property dictionaries returned by the LLM
+
+        Returns:
+            List of valid MechanicalProperty objects
+        """
+        if not isinstance(raw_properties, list):
+            logger.warning("Error parsing properties, expected a list: %s", raw_properties)
+            return []
+
+        # Clean up the data, numeric strings like "1,234.5" are converted by pydantic
+        raw_properties = [_clean_property(prop) for prop in raw_properties]
+
+        try:
+            return _PROPERTY_LIST_ADAPTER.validate_python(raw_properties)
+        except ValidationError as e:
+            # Errors are located by list index, drop those entries and validate the rest
+            invalid = {}
+            for error in e.errors():
+                invalid.setdefault(error["loc"][0], []).append(error["msg"])
+
+            for index, messages in invalid.items():
+                logger.warning("Error parsing property: %s, Error: %s", raw_properties[index], "; ".join(messages))
+
+            return _PROPERTY_LIST_ADAPTER.validate_python(
+                [prop for index, prop in enumerate(raw_properties) if index not in invalid]
+            )
\ No newline at end of file
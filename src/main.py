@@ -1,9 +1,15 @@
 """Main script for extracting and unifying mechanical property data from papers."""
 
-import json
+import asyncio
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
+import orjson
 from dotenv import load_dotenv
+from pydantic import ValidationError
 
 from .api.crossref_client import CrossrefClient
 from .extractors.llm_extractor import LLMExtractor
@@ -12,6 +18,8 @@ from .models.schemas import PaperMetadata, ExtractedData, UnifiedResults
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Define the papers to process
 PAPERS = [
     {
@@ -24,66 +32,239 @@ PAPERS = [
     }
 ]
 
+# Maximum number of papers processed concurrently
+MAX_WORKERS = 8
 
-def process_papers() -> List[ExtractedData]:
-    """Process all papers and extract mechanical properties.
+# Results of papers extracted in earlier runs, keyed by DOI
+MANIFEST_PATH = Path("output/processed.json")
+
+
+def _dedupe_papers(papers: List[Dict]) -> List[Dict]:
+    """Drop papers whose DOI already appeared earlier in the list.
+
+    Args:
+        papers: Entries with the DOI and title
 
     Returns:
-        List of ExtractedData objects
+        Papers with unique DOIs, in their original order
     """
-    # Initialize clients
-    crossref_client = CrossrefClient()
-    llm_extractor = LLMExtractor()
+    seen = set()
+    unique = []
 
-    # Create directories
-    pdf_dir = Path("data/pdfs")
-    pdf_dir.mkdir(parents=True, exist_ok=True)
+    for paper_info in papers:
+        doi = CrossrefClient.clean_doi(paper_info['doi'])
+        if doi not in seen:
+            seen.add(doi)
+            unique.append(paper_info)
 
-    output_dir = Path("output")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    return unique
+
+
+def _load_manifest(manifest_path: Path) -> Dict[str, ExtractedData]:
+    """Load results of papers processed in earlier runs.
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        Dictionary mapping normalized DOI to its extracted data
+    """
+    try:
+        raw_manifest = orjson.loads(manifest_path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable manifest %s: %s", manifest_path, e)
+        return {}
+
+    if not isinstance(raw_manifest, dict):
+        logger.warning("Ignoring unreadable manifest %s: expected an object", manifest_path)
+        return {}
+
+    manifest = {}
+    for doi, data in raw_manifest.items():
+        try:
+            manifest[doi] = ExtractedData.model_validate(data)
+        except ValidationError as e:
+            logger.warning("Ignoring invalid manifest entry for %s: %s", doi, e)
+
+    return manifest
+
+
+def _save_manifest(manifest: Dict[str, ExtractedData], manifest_path: Path):
+    """Save results of all processed papers for later runs.
+
+    Args:
+        manifest: Dictionary mapping normalized DOI to its extracted data
+        manifest_path: Path to the manifest file
+    """
+    # Write to a temporary file first so an interrupted run keeps the old manifest
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(
+        {doi: data.model_dump() for doi, data in manifest.items()},
+        option=orjson.OPT_INDENT_2
+    ))
+    tmp_path.replace(manifest_path)
+
+
+def _prepare_one(
+    paper_info: Dict,
+    crossref_client: CrossrefClient,
+    pdf_dir: Path
+) -> Optional[Tuple[Path, PaperMetadata]]:
+    """Fetch metadata and download the PDF for a single paper.
+
+    This is blocking and runs in a worker thread.
+
+    Args:
+        paper_info: Entry from PAPERS with the DOI and title
+        crossref_client: Shared Crossref client
+        pdf_dir: Directory to save the PDF
+
+    Returns:
+        Path to the PDF and the paper metadata, or None if the download failed
+    """
+    logger.info("=" * 60)
+    logger.info("Processing paper: %s...", paper_info['title'][:50])
+    logger.info("DOI: %s", paper_info['doi'])
+
+    # Fetch metadata from Crossref
+    logger.info("Fetching metadata from Crossref for %s...", paper_info['doi'])
+    metadata = crossref_client.get_metadata(paper_info['doi'])
+    extracted_info = crossref_client.extract_paper_info(metadata)
+
+    # Create PaperMetadata object
+    paper_metadata = PaperMetadata(
+        doi=extracted_info['doi'],
+        title=extracted_info['title'],
+        authors=extracted_info['authors'],
+        publication_date=str(extracted_info['publication_date'][0]) if extracted_info[
+            'publication_date'] else None,
+        journal=extracted_info['journal']
+    )
+
+    # Download PDF
+    logger.info("Downloading PDF for %s...", paper_info['doi'])
+    pdf_path = crossref_client.download_pdf(paper_info['doi'], pdf_dir)
+
+    if not pdf_path:
+        logger.error("Failed to download PDF for %s", paper_info['doi'])
+        return None
 
-    results = []
+    return pdf_path, paper_metadata
 
-    for paper_info in PAPERS:
-        print(f"\n{'=' * 60}")
-        print(f"Processing paper: {paper_info['title'][:50]}...")
-        print(f"DOI: {paper_info['doi']}")
 
+async def _process_one(
+    paper_info: Dict,
+    crossref_client: CrossrefClient,
+    llm_extractor: LLMExtractor,
+    pdf_dir: Path,
+    executor: ThreadPoolExecutor,
+    semaphore: asyncio.Semaphore
+) -> Optional[ExtractedData]:
+    """Fetch, download and extract a single paper.
+
+    Args:
+        paper_info: Entry from PAPERS with the DOI and title
+        crossref_client: Shared Crossref client
+        llm_extractor: Shared LLM extractor
+        pdf_dir: Directory to save the PDF
+        executor: Thread pool for the blocking Crossref and download steps
+        semaphore: Limits how many papers are processed at once
+
+    Returns:
+        ExtractedData object, or None if the paper could not be processed
+    """
+    async with semaphore:
         try:
-            # Fetch metadata from Crossref
-            print("\nFetching metadata from Crossref...")
-            metadata = crossref_client.get_metadata(paper_info['doi'])
-            extracted_info = crossref_client.extract_paper_info(metadata)
-
-            # Create PaperMetadata object
-            paper_metadata = PaperMetadata(
-                doi=extracted_info['doi'],
-                title=extracted_info['title'],
-                authors=extracted_info['authors'],
-                publication_date=str(extracted_info['publication_date'][0]) if extracted_info[
-                    'publication_date'] else None,
-                journal=extracted_info['journal']
+            loop = asyncio.get_running_loop()
+            prepared = await loop.run_in_executor(
+                executor, _prepare_one, paper_info, crossref_client, pdf_dir
             )
 
-            # Download PDF
-            print("\nDownloading PDF...")
-            pdf_path = crossref_client.download_pdf(paper_info['doi'], pdf_dir)
+            if prepared is None:
+                return None
 
-            if not pdf_path:
-                print(f"Failed to download PDF for {paper_info['doi']}")
-                continue
+            pdf_path, paper_metadata = prepared
 
             # Extract mechanical properties
-            print("\nExtracting mechanical properties...")
-            extracted_data = llm_extractor.extract_from_paper(pdf_path, paper_metadata)
-
-            results.append(extracted_data)
+            logger.info("Extracting mechanical properties for %s...", paper_info['doi'])
+            return await llm_extractor.aextract_from_paper(pdf_path, paper_metadata)
 
         except Exception as e:
-            print(f"Error processing paper {paper_info['doi']}: {e}")
-            continue
+            logger.error("Error processing paper %s: %s", paper_info['doi'], e)
+            return None
+
+
+async def process_papers_async() -> List[ExtractedData]:
+    """Process all papers concurrently and extract mechanical properties.
+
+    Duplicate DOIs are processed once, and papers found in the manifest
+    from an earlier run are not processed again.
+
+    Returns:
+        List of ExtractedData objects
+    """
+    # Create directories
+    pdf_dir = Path("data/pdfs")
+    pdf_dir.mkdir(parents=True, exist_ok=True)
+
+    output_dir = Path("output")
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    return results
+    papers = _dedupe_papers(PAPERS)
+    if len(papers) < len(PAPERS):
+        logger.info("Skipping %d duplicate papers", len(PAPERS) - len(papers))
+
+    # Reuse results of papers processed in earlier runs
+    manifest = _load_manifest(MANIFEST_PATH)
+    pending = [paper_info for paper_info in papers if CrossrefClient.clean_doi(paper_info['doi']) not in manifest]
+    if len(pending) < len(papers):
+        logger.info("Reusing %d papers already processed, see %s", len(papers) - len(pending), MANIFEST_PATH)
+
+    if pending:
+        semaphore = asyncio.Semaphore(MAX_WORKERS)
+        loop = asyncio.get_running_loop()
+
+        # Each worker thread reuses its own Chrome driver inside download_pdf
+        with CrossrefClient() as crossref_client, \
+                ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pending))) as executor:
+            async with LLMExtractor() as llm_extractor:
+                # Fetch all metadata in one request, workers then read it from the client's cache
+                logger.info("Fetching metadata from Crossref...")
+                try:
+                    await loop.run_in_executor(
+                        executor, crossref_client.get_metadata_batch, [paper_info['doi'] for paper_info in pending]
+                    )
+                except Exception as e:
+                    logger.warning("Batch metadata lookup failed, fetching per paper: %s", e)
+
+                tasks = [
+                    _process_one(paper_info, crossref_client, llm_extractor, pdf_dir, executor, semaphore)
+                    for paper_info in pending
+                ]
+
+                for paper_info, extracted_data in zip(pending, await asyncio.gather(*tasks)):
+                    if extracted_data is not None:
+                        manifest[CrossrefClient.clean_doi(paper_info['doi'])] = extracted_data
+
+        # Papers whose download or extraction failed are left out, so they are retried on the next run
+        _save_manifest(manifest, MANIFEST_PATH)
+
+    return [
+        manifest[CrossrefClient.clean_doi(paper_info['doi'])]
+        for paper_info in papers
+        if CrossrefClient.clean_doi(paper_info['doi']) in manifest
+    ]
+
+
+def process_papers() -> List[ExtractedData]:
+    """Process all papers and extract mechanical properties.
+
+    Returns:
+        List of ExtractedData objects
+    """
+    return asyncio.run(process_papers_async())
 
 
 def save_results(results: List[ExtractedData], output_path: Path):
@@ -103,28 +284,57 @@ def save_results(results: List[ExtractedData], output_path: Path):
         data=results
     )
 
-    # Save to JSON
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(unified.model_dump(), f, indent=2, default=str)
+    # Save to JSON, orjson serializes the datetime fields natively
+    output_path.write_bytes(orjson.dumps(unified.model_dump(), option=orjson.OPT_INDENT_2))
+
+    logger.info("Results saved to: %s", output_path)
+    logger.info("Papers processed: %d", unified.papers_processed)
+    logger.info("Total properties extracted: %d", unified.total_properties_extracted)
+
 
-    print(f"\nResults saved to: {output_path}")
-    print(f"Papers processed: {unified.papers_processed}")
-    print(f"Total properties extracted: {unified.total_properties_extracted}")
+def _setup_logging() -> QueueListener:
+    """Send log records through a queue drained by a single thread.
+
+    Worker threads only enqueue records, so they never contend on stderr.
+
+    Returns:
+        The started listener; stop it to flush the remaining records
+    """
+    log_queue = queue.SimpleQueue()
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = QueueListener(log_queue, handler)
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+
+    # httpx logs every OpenAI request at INFO
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    listener.start()
+    return listener
 
 
 def main():
     """Main entry point."""
-    print("Starting Crossref Data Extraction and Unification")
-    print("=" * 60)
+    listener = _setup_logging()
+
+    try:
+        logger.info("Starting Crossref Data Extraction and Unification")
+        logger.info("=" * 60)
 
-    # Process papers
-    results = process_papers()
+        # Process papers
+        results = process_papers()
 
-    # Save results
-    output_path = Path("output/results.json")
-    save_results(results, output_path)
+        # Save results
+        output_path = Path("output/results.json")
+        save_results(results, output_path)
 
-    print("\nExtraction complete!")
+        logger.info("Extraction complete!")
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
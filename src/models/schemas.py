@@ -1,12 +1,15 @@
 """Data Models for the crossref data extraction project."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 class MechanicalProperty(BaseModel):
     """Stands for a single mechanical property measurement"""
 
+    # Immutable once extracted, unknown fields from the LLM are dropped
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     material: str = Field(..., description="Material or alloy composition")
     condition: Optional[str] = Field(None, description="Processing condition or treatment")
     property_name: str = Field(..., description="Name of the mechanical property")
@@ -15,7 +18,7 @@ class MechanicalProperty(BaseModel):
     temperature: Optional[float] = Field(None, description="Test temperature if applicable")
     temperature_unit: Optional[str] = Field(None, description="Temperature unit")
     strain_rate: Optional[float] = Field(None, description="Strain rate if applicable")
-    additional_info: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Any additional parameters")
+    additional_info: Optional[Dict[str, Any]] = Field(None, description="Any additional parameters")
 
 
 class PaperMetadata(BaseModel):